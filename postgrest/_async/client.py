@@ -9,6 +9,7 @@ from .. import __version__
 from ..base_client import BasePostgrestClient
 from ..constants import (
     DEFAULT_POSTGREST_CLIENT_HEADERS,
+    DEFAULT_POSTGREST_CLIENT_LIMITS,
     DEFAULT_POSTGREST_CLIENT_TIMEOUT,
 )
 from ..utils import AsyncClient
@@ -45,6 +46,8 @@ class AsyncPostgrestClient(BasePostgrestClient):
             base_url=base_url,
             headers=headers,
             timeout=timeout,
+            limits=DEFAULT_POSTGREST_CLIENT_LIMITS,
+            http2=True,
         )
 
     async def __aenter__(self) -> AsyncPostgrestClient:
@@ -95,5 +98,10 @@ class AsyncPostgrestClient(BasePostgrestClient):
         """
         # the params here are params to be sent to the RPC and not the queryparams!
         return AsyncFilterRequestBuilder(
-            self.session, f"/rpc/{func}", "POST", Headers(), QueryParams(), json=params
+            self.session,
+            f"/rpc/{func}",
+            "POST",
+            Headers({"Content-Type": "application/json"}),
+            QueryParams(),
+            json=params,
         )
@@ -1 +1,2 @@
+# Generated from postgrest/_async/__init__.py by scripts/build_sync.py, do not edit.
 from __future__ import annotations
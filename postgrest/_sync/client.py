@@ -1,3 +1,4 @@
+# Generated from postgrest/_async/client.py by scripts/build_sync.py, do not edit.
 from __future__ import annotations
 
 from typing import Dict, Union, cast
@@ -9,6 +10,7 @@ from .. import __version__
 from ..base_client import BasePostgrestClient
 from ..constants import (
     DEFAULT_POSTGREST_CLIENT_HEADERS,
+    DEFAULT_POSTGREST_CLIENT_LIMITS,
     DEFAULT_POSTGREST_CLIENT_TIMEOUT,
 )
 from ..utils import SyncClient
@@ -45,6 +47,8 @@ class SyncPostgrestClient(BasePostgrestClient):
             base_url=base_url,
             headers=headers,
             timeout=timeout,
+            limits=DEFAULT_POSTGREST_CLIENT_LIMITS,
+            http2=True,
         )
 
     def __enter__(self) -> SyncPostgrestClient:
@@ -68,12 +72,12 @@ class SyncPostgrestClient(BasePostgrestClient):
         return SyncRequestBuilder(self.session, f"/{table}")
 
     def table(self, table: str) -> SyncRequestBuilder:
-        """Alias to self.from_()."""
+        """Alias to :meth:`from_`."""
         return self.from_(table)
 
     @deprecated("0.2.0", "1.0.0", __version__, "Use self.from_() instead")
     def from_table(self, table: str) -> SyncRequestBuilder:
-        """Alias to self.from_()."""
+        """Alias to :meth:`from_`."""
         return self.from_(table)
 
     def rpc(self, func: str, params: dict) -> SyncFilterRequestBuilder:
@@ -85,9 +89,9 @@ class SyncPostgrestClient(BasePostgrestClient):
         Returns:
             :class:`SyncFilterRequestBuilder`
         Example:
-            ::
+            .. code-block:: python
 
-                await client.rpc("foobar", {"arg": "value"}).execute()
+                client.rpc("foobar", {"arg": "value"}).execute()
 
         .. versionchanged:: 0.11.0
             This method now returns a :class:`SyncFilterRequestBuilder` which allows you to
@@ -95,5 +99,10 @@ class SyncPostgrestClient(BasePostgrestClient):
         """
         # the params here are params to be sent to the RPC and not the queryparams!
         return SyncFilterRequestBuilder(
-            self.session, f"/rpc/{func}", "POST", Headers(), QueryParams(), json=params
+            self.session,
+            f"/rpc/{func}",
+            "POST",
+            Headers({"Content-Type": "application/json"}),
+            QueryParams(),
+            json=params,
         )
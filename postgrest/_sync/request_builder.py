@@ -1,9 +1,11 @@
+# Generated from postgrest/_async/request_builder.py by scripts/build_sync.py, do not edit.
 from __future__ import annotations
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Type, TypeVar, Union
+from warnings import warn
 
 from httpx import Headers, QueryParams
-from pydantic import ValidationError
 
 from ..base_request_builder import (
     APIResponse,
@@ -19,10 +21,30 @@ from ..base_request_builder import (
 )
 from ..exceptions import APIError
 from ..types import ReturnMethod
-from ..utils import SyncClient
+from ..utils import SyncClient, json_dumps, json_loads
+
+_SingleT = TypeVar("_SingleT", bound="SyncSingleRequestBuilder")
+
+# Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
+_SUCCESS_STATUS_CODES = frozenset(range(200, 300))
+
+# returned by maybe_single() when no row matched, callers get a (cheap) copy
+_EMPTY_SINGLE_RESPONSE = SingleAPIResponse.construct(data=None, count=0)
 
 
 class SyncQueryRequestBuilder:
+    __slots__ = (
+        "session",
+        "path",
+        "http_method",
+        "headers",
+        "params",
+        "json",
+        "_request",
+        "_encoded_params",
+        "_url",
+    )
+
     def __init__(
         self,
         session: SyncClient,
@@ -33,17 +55,44 @@ class SyncQueryRequestBuilder:
         json: dict,
     ) -> None:
         self.session = session
+        self._request = session.request
         self.path = path
+        self._encoded_params: Optional[QueryParams] = None
+        self._url = path
         self.http_method = http_method
         self.headers = headers
         self.params = params
         self.json = json
 
+    @classmethod
+    def gather(
+        cls,
+        *builders: Union[SyncQueryRequestBuilder, SyncSingleRequestBuilder],
+        concurrency: int = 10,
+    ) -> List[Union[APIResponse, SingleAPIResponse]]:
+        """Execute several queries concurrently, in a thread pool.
+
+        Args:
+            *builders: The queries to execute.
+            concurrency: The maximum number of queries running at the same time.
+        Returns:
+            The responses, in the same order as the queries.
+
+        Raises:
+            :class:`ValueError` If concurrency is lower than 1.
+            :class:`APIError` If any of the queries raised an error.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lambda builder: builder.execute(), builders))
+
     def execute(self) -> APIResponse:
         """Execute the query.
 
         .. tip::
             This is the last method called, after the query is built.
+            Independent queries can be executed concurrently with :meth:`gather`.
 
         Returns:
             :class:`APIResponse`
@@ -51,25 +100,35 @@ class SyncQueryRequestBuilder:
         Raises:
             :class:`APIError` If the API raised an error.
         """
-        r = self.session.request(
+        if self.params is not self._encoded_params:
+            # params are immutable and replaced by every filter, so the url only needs
+            # to be encoded again when they are a different object
+            self._encoded_params = self.params
+            self._url = f"{self.path}?{self.params}" if self.params else self.path
+        r = self._request(
             self.http_method,
-            self.path,
-            json=self.json,
-            params=self.params,
+            self._url,
+            content=None if self.json is None else json_dumps(self.json),
             headers=self.headers,
         )
-        try:
-            if (
-                200 <= r.status_code <= 299
-            ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
-                return APIResponse.from_http_request_response(r)
-            else:
-                raise APIError(r.json())
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+        if r.status_code in _SUCCESS_STATUS_CODES:
+            return APIResponse.from_http_request_response(r)
+        raise APIError(json_loads(r.content))
 
 
 class SyncSingleRequestBuilder:
+    __slots__ = (
+        "session",
+        "path",
+        "http_method",
+        "headers",
+        "params",
+        "json",
+        "_request",
+        "_encoded_params",
+        "_url",
+    )
+
     def __init__(
         self,
         session: SyncClient,
@@ -80,12 +139,34 @@ class SyncSingleRequestBuilder:
         json: dict,
     ) -> None:
         self.session = session
+        self._request = session.request
         self.path = path
+        self._encoded_params: Optional[QueryParams] = None
+        self._url = path
         self.http_method = http_method
         self.headers = headers
         self.params = params
         self.json = json
 
+    @classmethod
+    def _from_parent(
+        cls: Type[_SingleT], parent: SyncSelectRequestBuilder, accept: str
+    ) -> _SingleT:
+        # bypasses __init__, the state is taken from the parent builder as is
+        builder = cls.__new__(cls)
+        builder.session = parent.session
+        builder._request = parent._request
+        builder.path = parent.path
+        builder._encoded_params = parent._encoded_params
+        builder._url = parent._url
+        builder.http_method = parent.http_method
+        headers = parent.headers.copy()
+        headers["Accept"] = accept
+        builder.headers = headers
+        builder.params = parent.params
+        builder.json = parent.json
+        return builder
+
     def execute(self) -> SingleAPIResponse:
         """Execute the query.
 
@@ -98,38 +179,38 @@ class SyncSingleRequestBuilder:
         Raises:
             :class:`APIError` If the API raised an error.
         """
-        r = self.session.request(
+        if self.params is not self._encoded_params:
+            # params are immutable and replaced by every filter, so the url only needs
+            # to be encoded again when they are a different object
+            self._encoded_params = self.params
+            self._url = f"{self.path}?{self.params}" if self.params else self.path
+        r = self._request(
             self.http_method,
-            self.path,
-            json=self.json,
-            params=self.params,
+            self._url,
+            content=None if self.json is None else json_dumps(self.json),
             headers=self.headers,
         )
-        try:
-            if (
-                200 <= r.status_code <= 299
-            ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
-                return SingleAPIResponse.from_http_request_response(r)
-            else:
-                raise APIError(r.json())
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+        if r.status_code in _SUCCESS_STATUS_CODES:
+            return SingleAPIResponse.from_http_request_response(r)
+        raise APIError(json_loads(r.content))
 
 
 class SyncMaybeSingleRequestBuilder(SyncSingleRequestBuilder):
+    __slots__ = ()
+
     def execute(self) -> SingleAPIResponse:
         r = None
         try:
             r = super().execute()
         except APIError as e:
-            if e.details and "Results contain 0 rows" in e.details:
-                return SingleAPIResponse.from_dict(
-                    {
-                        "data": None,
-                        "error": None,
-                        "count": 0,  # NOTE: needs to take value from res.count
-                    }
-                )
+            # PGRST116 is raised for both zero and multiple rows, the details tell
+            # them apart; older servers only send the details
+            if e.details and (
+                (e.code == "PGRST116" and " 0 rows" in e.details)
+                or "Results contain 0 rows" in e.details
+            ):
+                # NOTE: count needs to take value from res.count
+                return _EMPTY_SINGLE_RESPONSE.copy()
         if not r:
             raise APIError(
                 {
@@ -144,6 +225,8 @@ class SyncMaybeSingleRequestBuilder(SyncSingleRequestBuilder):
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncFilterRequestBuilder(BaseFilterRequestBuilder, SyncQueryRequestBuilder):  # type: ignore
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -153,14 +236,16 @@ class SyncFilterRequestBuilder(BaseFilterRequestBuilder, SyncQueryRequestBuilder
         params: QueryParams,
         json: dict,
     ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
         SyncQueryRequestBuilder.__init__(
             self, session, path, http_method, headers, params, json
         )
+        self.negate_next = False
 
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder):  # type: ignore
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -170,10 +255,10 @@ class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder
         params: QueryParams,
         json: dict,
     ) -> None:
-        BaseSelectRequestBuilder.__init__(self, session, headers, params)
         SyncQueryRequestBuilder.__init__(
             self, session, path, http_method, headers, params, json
         )
+        self.negate_next = False
 
     def single(self) -> SyncSingleRequestBuilder:
         """Specify that the query will only return a single row in response.
@@ -181,31 +266,28 @@ class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder
         .. caution::
             The API will raise an error if the query returned more than one row.
         """
-        self.headers["Accept"] = "application/vnd.pgrst.object+json"
-        return SyncSingleRequestBuilder(
-            headers=self.headers,
-            http_method=self.http_method,
-            json=self.json,
-            params=self.params,
-            path=self.path,
-            session=self.session,  # type: ignore
+        return SyncSingleRequestBuilder._from_parent(
+            self, "application/vnd.pgrst.object+json"
         )
 
     def maybe_single(self) -> SyncMaybeSingleRequestBuilder:
         """Retrieves at most one row from the result. Result must be at most one row (e.g. using `eq` on a UNIQUE column), otherwise this will result in an error."""
-        self.headers["Accept"] = "application/vnd.pgrst.object+json"
-        return SyncMaybeSingleRequestBuilder(
-            headers=self.headers,
-            http_method=self.http_method,
-            json=self.json,
-            params=self.params,
-            path=self.path,
-            session=self.session,  # type: ignore
+        return SyncMaybeSingleRequestBuilder._from_parent(
+            self, "application/vnd.pgrst.object+json"
         )
 
 
 class SyncRequestBuilder:
+    __slots__ = ("session", "path")
+
     def __init__(self, session: SyncClient, path: str) -> None:
+        if session.is_closed:
+            warn(
+                "Building a query on a closed client, reuse a single open client "
+                "and close it once with aclose()",
+                RuntimeWarning,
+                stacklevel=2,
+            )
         self.session = session
         self.path = path
 
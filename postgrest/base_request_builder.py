@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from re import search
 from typing import (
     Any,
@@ -20,7 +21,7 @@ from httpx import Response as RequestResponse
 from pydantic import BaseModel, validator
 
 from .types import CountMethod, Filters, RequestMethod, ReturnMethod
-from .utils import AsyncClient, SyncClient, sanitize_param
+from .utils import AsyncClient, SyncClient, json_loads, sanitize_param
 
 
 class QueryArgs(NamedTuple):
@@ -31,21 +32,48 @@ class QueryArgs(NamedTuple):
     json: Dict[Any, Any]
 
 
-def pre_select(
-    *columns: str,
-    count: Optional[CountMethod] = None,
-) -> QueryArgs:
+# The headers and params below only depend on a few hashable arguments, so they are
+# built once and cached. Headers are mutable (e.g. `.range()`, `.single()`), callers
+# get a copy; QueryParams are immutable and can be shared.
+@lru_cache(maxsize=256)
+def _select_meta(
+    columns: Tuple[str, ...], count: Optional[CountMethod]
+) -> Tuple[RequestMethod, QueryParams, Headers]:
     if columns:
         method = RequestMethod.GET
         params = QueryParams({"select": ",".join(columns)})
     else:
         method = RequestMethod.HEAD
         params = QueryParams()
+    headers = Headers({"Content-Type": "application/json"})
     if count:
-        headers = Headers({"Prefer": f"count={count}"})
-    else:
-        headers = Headers()
-    return QueryArgs(method, params, headers, {})
+        headers["Prefer"] = f"count={count}"
+    return method, params, headers
+
+
+@lru_cache(maxsize=256)
+def _write_headers(
+    count: Optional[CountMethod], returning: ReturnMethod, resolution: Optional[str]
+) -> Headers:
+    prefer_headers = [f"return={returning}"]
+    if count:
+        prefer_headers.append(f"count={count}")
+    if resolution:
+        prefer_headers.append(f"resolution={resolution}-duplicates")
+    return Headers(
+        {"Content-Type": "application/json", "Prefer": ",".join(prefer_headers)}
+    )
+
+
+_EMPTY_PARAMS = QueryParams()
+
+
+def pre_select(
+    *columns: str,
+    count: Optional[CountMethod] = None,
+) -> QueryArgs:
+    method, params, headers = _select_meta(columns, count)
+    return QueryArgs(method, params, headers.copy(), {})
 
 
 def pre_insert(
@@ -55,13 +83,8 @@ def pre_insert(
     returning: ReturnMethod,
     upsert: bool,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    if upsert:
-        prefer_headers.append("resolution=merge-duplicates")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
-    return QueryArgs(RequestMethod.POST, QueryParams(), headers, json)
+    headers = _write_headers(count, returning, "merge" if upsert else None)
+    return QueryArgs(RequestMethod.POST, _EMPTY_PARAMS, headers.copy(), json)
 
 
 def pre_upsert(
@@ -71,13 +94,9 @@ def pre_upsert(
     returning: ReturnMethod,
     ignore_duplicates: bool,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
     resolution = "ignore" if ignore_duplicates else "merge"
-    prefer_headers.append(f"resolution={resolution}-duplicates")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
-    return QueryArgs(RequestMethod.POST, QueryParams(), headers, json)
+    headers = _write_headers(count, returning, resolution)
+    return QueryArgs(RequestMethod.POST, _EMPTY_PARAMS, headers.copy(), json)
 
 
 def pre_update(
@@ -86,11 +105,8 @@ def pre_update(
     count: Optional[CountMethod],
     returning: ReturnMethod,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
-    return QueryArgs(RequestMethod.PATCH, QueryParams(), headers, json)
+    headers = _write_headers(count, returning, None)
+    return QueryArgs(RequestMethod.PATCH, _EMPTY_PARAMS, headers.copy(), json)
 
 
 def pre_delete(
@@ -98,11 +114,8 @@ def pre_delete(
     count: Optional[CountMethod],
     returning: ReturnMethod,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
-    return QueryArgs(RequestMethod.DELETE, QueryParams(), headers, {})
+    headers = _write_headers(count, returning, None)
+    return QueryArgs(RequestMethod.DELETE, _EMPTY_PARAMS, headers.copy(), {})
 
 
 class APIResponse(BaseModel):
@@ -152,9 +165,10 @@ class APIResponse(BaseModel):
     def from_http_request_response(
         cls: Type[APIResponse], request_response: RequestResponse
     ) -> APIResponse:
-        data = request_response.json()
+        data = json_loads(request_response.content)
         count = cls._get_count_from_http_request_response(request_response)
-        return cls(data=data, count=count)
+        # the payload comes from a successful PostgREST response, skip validation
+        return cls.construct(data=data, count=count)
 
     @classmethod
     def from_dict(cls: Type[APIResponse], dict: Dict[str, Any]) -> APIResponse:
@@ -173,9 +187,10 @@ class SingleAPIResponse(APIResponse):
     def from_http_request_response(
         cls: Type[SingleAPIResponse], request_response: RequestResponse
     ) -> SingleAPIResponse:
-        data = request_response.json()
+        data = json_loads(request_response.content)
         count = cls._get_count_from_http_request_response(request_response)
-        return cls(data=data, count=count)
+        # the payload comes from a successful PostgREST response, skip validation
+        return cls.construct(data=data, count=count)
 
     @classmethod
     def from_dict(
@@ -192,16 +207,15 @@ _FilterT = TypeVar("_FilterT", bound="BaseFilterRequestBuilder")
 
 
 class BaseFilterRequestBuilder:
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        self.session = session
-        self.headers = headers
-        self.params = params
-        self.negate_next = False
+    # mixin only: the slots and the initializer live on the concrete builders, a
+    # second non-empty base layout would conflict with the query builder they
+    # are mixed with
+    __slots__ = ()
+
+    session: Union[AsyncClient, SyncClient]
+    headers: Headers
+    params: QueryParams
+    negate_next: bool
 
     @property
     def not_(self: _FilterT) -> _FilterT:
@@ -389,13 +403,7 @@ class BaseFilterRequestBuilder:
 
 
 class BaseSelectRequestBuilder(BaseFilterRequestBuilder):
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
+    __slots__ = ()
 
     def order(
         self: _FilterT,
@@ -1,10 +1,52 @@
 from __future__ import annotations
 
-from typing import Any
+from json import dumps as _json_dumps
+from json import loads as _json_loads
+from types import ModuleType
+from typing import Any, Optional
 
 from httpx import AsyncClient  # noqa: F401
 from httpx import Client as BaseClient  # noqa: F401
 
+# set by use_orjson(), orjson is never picked up just because it is installed
+_orjson: Optional[ModuleType] = None
+
+
+def use_orjson(enabled: bool = True) -> None:
+    """Encode and decode request and response bodies with orjson.
+
+    .. caution::
+        orjson decodes integers that do not fit in 64 bits as floats.
+
+    Args:
+        enabled: Whether to use orjson, or go back to the standard library.
+    Raises:
+        :class:`ImportError` If orjson is not installed.
+    """
+    global _orjson
+    if enabled:
+        import orjson
+
+        _orjson = orjson
+    else:
+        _orjson = None
+
+
+def json_loads(content: bytes) -> Any:
+    if _orjson is None:
+        return _json_loads(content)
+    return _orjson.loads(content)
+
+
+def json_dumps(obj: Any) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except _orjson.JSONEncodeError:
+            # orjson rejects integers above 64 bits and non-str dict keys
+            pass
+    return _json_dumps(obj).encode("utf-8")
+
 
 class SyncClient(BaseClient):
     def aclose(self) -> None:
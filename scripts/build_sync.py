@@ -0,0 +1,103 @@
+"""Generate the synchronous modules and tests from their asynchronous sources.
+
+``postgrest/_async`` and ``tests/_async`` are the single source of truth, every
+file in them is converted with unasync and written to the matching ``_sync``
+directory. Run it with ``make build_sync`` (it also runs as a pre-commit hook).
+"""
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import unasync
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIRS = ("postgrest/_async", "tests/_async")
+
+HEADER = "# Generated from {source} by scripts/build_sync.py, do not edit.\n"
+
+# code that has no token-by-token sync equivalent, replaced before unasync runs
+OVERRIDES = {
+    "postgrest/_async/request_builder.py": {
+        "import asyncio\n": "from concurrent.futures import ThreadPoolExecutor\n",
+        "Execute several queries concurrently.": (
+            "Execute several queries concurrently, in a thread pool."
+        ),
+        """\
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(
+            builder: Union[AsyncQueryRequestBuilder, AsyncSingleRequestBuilder]
+        ) -> Union[APIResponse, SingleAPIResponse]:
+            async with semaphore:
+                return await builder.execute()
+
+        return list(await asyncio.gather(*(run(builder) for builder in builders)))
+""": """\
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lambda builder: builder.execute(), builders))
+""",
+    },
+}
+
+# unasync only renames whole tokens, these also cover docstrings and strings
+SUBSTITUTIONS = (
+    (re.compile(r"\bAsync(?=[A-Z])"), "Sync"),
+    (re.compile(r"\b_async\b"), "_sync"),
+    (re.compile(r"\bawait "), ""),
+)
+
+_RULE = unasync.Rule(fromdir="/_async/", todir="/_sync/")
+
+
+def unasync_source(source: str) -> str:
+    # unasync only exposes whole-file conversion, these internals are why the dev
+    # dependency is pinned in pyproject.toml
+    tokens = unasync._tokenize(BytesIO(source.encode("utf-8")))
+    return unasync._untokenize(_RULE._unasync_tokens(tokens))
+
+
+def build(source_path: Path) -> Path:
+    relative = source_path.relative_to(ROOT).as_posix()
+    source = source_path.read_text(encoding="utf-8")
+    for old, new in OVERRIDES.get(relative, {}).items():
+        if old not in source:
+            raise ValueError(f"{relative}: override no longer matches:\n{old}")
+        source = source.replace(old, new)
+    result = unasync_source(source)
+    for pattern, replacement in SUBSTITUTIONS:
+        result = pattern.sub(replacement, result)
+    if result:
+        result = HEADER.format(source=relative) + result
+    target_path = ROOT / relative.replace("/_async/", "/_sync/")
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    target_path.write_text(result, encoding="utf-8")
+    return target_path
+
+
+def main() -> None:
+    targets = [
+        build(path)
+        for directory in SOURCE_DIRS
+        for path in sorted((ROOT / directory).glob("*.py"))
+    ]
+    # removing async/await can leave lines that black would join
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "black",
+            "--quiet",
+            "--line-length",
+            "90",
+            *map(str, targets),
+        ],
+        check=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
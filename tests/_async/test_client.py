@@ -115,3 +115,49 @@ async def test_response_maybe_single(postgrest_client: AsyncPostgrestClient):
         exc_response = exc_info.value.json()
         assert isinstance(exc_response.get("message"), str)
         assert "code" in exc_response and int(exc_response["code"]) == 204
+
+
+@pytest.mark.asyncio
+async def test_response_maybe_single_with_multiple_rows(
+    postgrest_client: AsyncPostgrestClient,
+):
+    with patch(
+        "postgrest._async.request_builder.AsyncSingleRequestBuilder.execute",
+        side_effect=APIError(
+            {
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "hint": None,
+                "details": "The result contains 2 rows",
+            }
+        ),
+    ):
+        client = (
+            postgrest_client.from_("test").select("a", "b").eq("c", "d").maybe_single()
+        )
+        with pytest.raises(APIError) as exc_info:
+            await client.execute()
+        assert exc_info.value.code == "204"
+
+
+@pytest.mark.asyncio
+async def test_response_maybe_single_without_rows(postgrest_client: AsyncPostgrestClient):
+    with patch(
+        "postgrest._async.request_builder.AsyncSingleRequestBuilder.execute",
+        side_effect=APIError(
+            {
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "hint": None,
+                "details": "The result contains 0 rows",
+            }
+        ),
+    ):
+        client = (
+            postgrest_client.from_("test").select("a", "b").eq("c", "d").maybe_single()
+        )
+        response = await client.execute()
+        assert response.data is None
+        assert response.count == 0
+        response.count = 1
+        assert (await client.execute()).count == 0
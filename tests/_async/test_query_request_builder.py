@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from httpx import Headers, QueryParams
 
@@ -21,3 +23,36 @@ def test_constructor(query_request_builder: AsyncQueryRequestBuilder):
     assert len(builder.params) == 0
     assert builder.http_method == "GET"
     assert builder.json == {}
+
+
+def test_builder_has_no_instance_dict(query_request_builder: AsyncQueryRequestBuilder):
+    assert not hasattr(query_request_builder, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_gather(query_request_builder: AsyncQueryRequestBuilder):
+    async def execute(self):
+        return self.path
+
+    builders = [
+        AsyncQueryRequestBuilder(
+            query_request_builder.session,
+            f"/table_{i}",
+            "GET",
+            Headers(),
+            QueryParams(),
+            {},
+        )
+        for i in range(5)
+    ]
+    with patch.object(AsyncQueryRequestBuilder, "execute", execute):
+        responses = await AsyncQueryRequestBuilder.gather(*builders, concurrency=2)
+    assert responses == [f"/table_{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_gather_rejects_zero_concurrency(
+    query_request_builder: AsyncQueryRequestBuilder,
+):
+    with pytest.raises(ValueError):
+        await AsyncQueryRequestBuilder.gather(query_request_builder, concurrency=0)
@@ -1,3 +1,4 @@
+# Generated from tests/_async/test_client.py by scripts/build_sync.py, do not edit.
 from unittest.mock import patch
 
 import pytest
@@ -115,3 +116,49 @@ def test_response_maybe_single(postgrest_client: SyncPostgrestClient):
         exc_response = exc_info.value.json()
         assert isinstance(exc_response.get("message"), str)
         assert "code" in exc_response and int(exc_response["code"]) == 204
+
+
+@pytest.mark.asyncio
+def test_response_maybe_single_with_multiple_rows(
+    postgrest_client: SyncPostgrestClient,
+):
+    with patch(
+        "postgrest._sync.request_builder.SyncSingleRequestBuilder.execute",
+        side_effect=APIError(
+            {
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "hint": None,
+                "details": "The result contains 2 rows",
+            }
+        ),
+    ):
+        client = (
+            postgrest_client.from_("test").select("a", "b").eq("c", "d").maybe_single()
+        )
+        with pytest.raises(APIError) as exc_info:
+            client.execute()
+        assert exc_info.value.code == "204"
+
+
+@pytest.mark.asyncio
+def test_response_maybe_single_without_rows(postgrest_client: SyncPostgrestClient):
+    with patch(
+        "postgrest._sync.request_builder.SyncSingleRequestBuilder.execute",
+        side_effect=APIError(
+            {
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "hint": None,
+                "details": "The result contains 0 rows",
+            }
+        ),
+    ):
+        client = (
+            postgrest_client.from_("test").select("a", "b").eq("c", "d").maybe_single()
+        )
+        response = client.execute()
+        assert response.data is None
+        assert response.count == 0
+        response.count = 1
+        assert (client.execute()).count == 0
@@ -1,3 +1,4 @@
+# Generated from tests/_async/test_filter_request_builder.py by scripts/build_sync.py, do not edit.
 import pytest
 from httpx import Headers, QueryParams
 
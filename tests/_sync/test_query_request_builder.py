@@ -1,3 +1,6 @@
+# Generated from tests/_async/test_query_request_builder.py by scripts/build_sync.py, do not edit.
+from unittest.mock import patch
+
 import pytest
 from httpx import Headers, QueryParams
 
@@ -21,3 +24,36 @@ def test_constructor(query_request_builder: SyncQueryRequestBuilder):
     assert len(builder.params) == 0
     assert builder.http_method == "GET"
     assert builder.json == {}
+
+
+def test_builder_has_no_instance_dict(query_request_builder: SyncQueryRequestBuilder):
+    assert not hasattr(query_request_builder, "__dict__")
+
+
+@pytest.mark.asyncio
+def test_gather(query_request_builder: SyncQueryRequestBuilder):
+    def execute(self):
+        return self.path
+
+    builders = [
+        SyncQueryRequestBuilder(
+            query_request_builder.session,
+            f"/table_{i}",
+            "GET",
+            Headers(),
+            QueryParams(),
+            {},
+        )
+        for i in range(5)
+    ]
+    with patch.object(SyncQueryRequestBuilder, "execute", execute):
+        responses = SyncQueryRequestBuilder.gather(*builders, concurrency=2)
+    assert responses == [f"/table_{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+def test_gather_rejects_zero_concurrency(
+    query_request_builder: SyncQueryRequestBuilder,
+):
+    with pytest.raises(ValueError):
+        SyncQueryRequestBuilder.gather(query_request_builder, concurrency=0)
@@ -1,12 +1,16 @@
+# Generated from tests/_async/test_request_builder.py by scripts/build_sync.py, do not edit.
+import json
 from typing import Any, Dict, List
 
 import pytest
-from httpx import Request, Response
+from httpx import MockTransport, Request, Response
 
 from postgrest import SyncRequestBuilder
+from postgrest._sync.request_builder import SyncMaybeSingleRequestBuilder
 from postgrest.base_request_builder import APIResponse, SingleAPIResponse
+from postgrest.exceptions import APIError
 from postgrest.types import CountMethod
-from postgrest.utils import SyncClient
+from postgrest.utils import SyncClient, use_orjson
 
 
 @pytest.fixture
@@ -15,10 +19,25 @@ def request_builder():
         yield SyncRequestBuilder(client, "/example_table")
 
 
+@pytest.fixture
+def orjson_enabled():
+    use_orjson()
+    yield
+    use_orjson(False)
+
+
 def test_constructor(request_builder):
     assert request_builder.path == "/example_table"
 
 
+@pytest.mark.asyncio
+def test_constructor_warns_on_closed_client():
+    client = SyncClient()
+    client.aclose()
+    with pytest.warns(RuntimeWarning):
+        SyncRequestBuilder(client, "/example_table")
+
+
 class TestSelect:
     def test_select(self, request_builder: SyncRequestBuilder):
         builder = request_builder.select("col1", "col2")
@@ -36,6 +55,60 @@ class TestSelect:
         assert builder.http_method == "HEAD"
         assert builder.json == {}
 
+    def test_select_headers_not_shared(self, request_builder: SyncRequestBuilder):
+        builder = request_builder.select("col1", count=CountMethod.exact).range(0, 10)
+        other = request_builder.select("col1", count=CountMethod.exact)
+
+        assert builder.headers["range"] == "0-9"
+        assert other.headers.get("range") is None
+
+    def test_write_headers_not_shared(self, request_builder: SyncRequestBuilder):
+        builder = request_builder.insert({"key1": "val1"})
+        builder.headers["x-custom"] = "value"
+        other = request_builder.insert({"key1": "val1"})
+
+        assert other.headers.get("x-custom") is None
+
+    def test_single_does_not_change_parent_headers(
+        self, request_builder: SyncRequestBuilder
+    ):
+        builder = request_builder.select("col1")
+        single = builder.single()
+
+        assert single.headers["accept"] == "application/vnd.pgrst.object+json"
+        assert builder.headers.get("accept") is None
+
+    def test_maybe_single_keeps_query(self, request_builder: SyncRequestBuilder):
+        builder = request_builder.select("col1").eq("col1", "val1")
+        maybe_single = builder.maybe_single()
+
+        assert isinstance(maybe_single, SyncMaybeSingleRequestBuilder)
+        assert maybe_single.session is builder.session
+        assert maybe_single.path == builder.path
+        assert maybe_single.http_method == builder.http_method
+        assert maybe_single.params == builder.params
+        assert maybe_single.json == builder.json
+
+    @pytest.mark.asyncio
+    def test_select_encodes_params_in_url(self):
+        urls = []
+
+        def handler(request: Request) -> Response:
+            urls.append(str(request.url))
+            return Response(200, json=[])
+
+        with SyncClient(
+            base_url="https://example.com", transport=MockTransport(handler)
+        ) as client:
+            builder = SyncRequestBuilder(client, "/example_table").select("col1")
+            builder.eq("col1", "val1").execute()
+            builder.neq("col1", "val2").execute()
+
+        assert urls == [
+            "https://example.com/example_table?select=col1&col1=eq.val1",
+            "https://example.com/example_table?select=col1&col1=eq.val1&col1=neq.val2",
+        ]
+
 
 class TestInsert:
     def test_insert(self, request_builder: SyncRequestBuilder):
@@ -75,6 +148,37 @@ class TestInsert:
         assert builder.http_method == "POST"
         assert builder.json == {"key1": "val1"}
 
+    @pytest.mark.asyncio
+    def test_insert_sends_json_body(self):
+        def handler(request: Request) -> Response:
+            assert request.headers["content-type"] == "application/json"
+            assert json.loads(request.content) == {"key1": "val1"}
+            return Response(201, json=[{"key1": "val1"}])
+
+        with SyncClient(
+            base_url="https://example.com", transport=MockTransport(handler)
+        ) as client:
+            builder = SyncRequestBuilder(client, "/example_table").insert(
+                {"key1": "val1"}
+            )
+            response = builder.execute()
+
+        assert response.data == [{"key1": "val1"}]
+
+    @pytest.mark.asyncio
+    def test_insert_sends_big_integers(self, orjson_enabled):
+        def handler(request: Request) -> Response:
+            assert json.loads(request.content) == {"key1": 2**70}
+            return Response(201, json=[])
+
+        with SyncClient(
+            base_url="https://example.com", transport=MockTransport(handler)
+        ) as client:
+            builder = SyncRequestBuilder(client, "/example_table").insert(
+                {"key1": 2**70}
+            )
+            builder.execute()
+
 
 class TestUpdate:
     def test_update(self, request_builder: SyncRequestBuilder):
@@ -268,6 +372,15 @@ class TestApiResponse:
         assert result.data == api_response
         assert result.count == count
 
+    def test_decodes_big_integers_exactly_by_default(self):
+        response = Response(
+            200,
+            content=json.dumps([{"id": 2**70}]),
+            request=Request(method="GET", url="http://example.com"),
+        )
+        result = APIResponse.from_http_request_response(response)
+        assert result.data == [{"id": 2**70}]
+
     def test_get_count_from_content_range_header_with_count(
         self, content_range_header_with_count: str
     ):
@@ -342,3 +455,21 @@ class TestApiResponse:
         assert isinstance(result.data, dict)
         assert result.data == single_api_response
         assert result.count == 2
+
+
+@pytest.mark.asyncio
+def test_execute_raises_a_new_error_payload_each_time():
+    def handler(request: Request) -> Response:
+        return Response(400, json={"message": "mock error", "code": "400"})
+
+    with SyncClient(
+        base_url="https://example.com", transport=MockTransport(handler)
+    ) as client:
+        builder = SyncRequestBuilder(client, "/example_table").select("*")
+        with pytest.raises(APIError) as first:
+            builder.execute()
+        first.value.json()["message"] = "changed"
+        with pytest.raises(APIError) as second:
+            builder.execute()
+
+    assert second.value.json() == {"message": "mock error", "code": "400"}